@@ -0,0 +1,51 @@
+# -----------------------------------------------------------
+# ESTILO VISUAL compartido por las apps LTPD
+# Autor: Juan Camilo Plazas
+# Descripción:
+# Gráfico Altair de la curva CO / OC y su fragmento interactivo. Los colores y la fuente de la app se
+# definen en el tema de .streamlit/config.toml (sin CSS inyectado en cada rerun).
+# -----------------------------------------------------------
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+
+def grafico_curva(p_vals, Pa_vals, pL_percent, beta, titulo, etiqueta, grosor=2):
+    """
+    Construye el gráfico Altair de la curva junto con las líneas de LTPD y β.
+    Solo se envían los datos (p, Pₐ) al navegador, que es quien dibuja.
+    """
+    etiqueta_ltpd = f"LTPD = {pL_percent:.2f}%"
+    etiqueta_beta = f"β = {beta*100:.1f}%"
+    colores = alt.Scale(domain=[etiqueta, etiqueta_ltpd, etiqueta_beta],
+                        range=["#2563eb", "green", "red"])
+    color = alt.Color("serie:N", scale=colores, title=None)
+    df = pd.DataFrame({"p": p_vals, "Pa": Pa_vals, "serie": etiqueta})
+    curva = alt.Chart(df).mark_line(strokeWidth=grosor).encode(
+        x=alt.X("p:Q", title="% de unidades defectuosas en el lote"),
+        y=alt.Y("Pa:Q", title="Probabilidad de aceptación (%)"),
+        color=color,
+        tooltip=[alt.Tooltip("p:Q", title="% defectuosos", format=".2f"),
+                 alt.Tooltip("Pa:Q", title="Pₐ (%)", format=".2f")],
+    ).interactive()  # zoom y desplazamiento con la rueda y el arrastre
+    linea_ltpd = alt.Chart(pd.DataFrame({"p": [pL_percent], "serie": [etiqueta_ltpd]})).mark_rule(
+        strokeDash=[6, 4]).encode(x="p:Q", color=color)
+    linea_beta = alt.Chart(pd.DataFrame({"Pa": [beta*100], "serie": [etiqueta_beta]})).mark_rule(
+        strokeDash=[6, 4]).encode(y="Pa:Q", color=color)
+    return (curva + linea_ltpd + linea_beta).properties(title=titulo, height=320)
+
+
+@st.fragment
+def seccion_curva(curva, pL_percent, beta, titulo, etiqueta, grosor=2):
+    """
+    Fragmento con el deslizador del rango de p y el gráfico de la curva:
+    moverlo solo re-ejecuta este bloque, no la búsqueda de n.
+    curva(p_max) devuelve (p_vals, Pa_vals) en porcentaje y debe estar en caché.
+    """
+    p_max_pct = st.slider("Rango de la curva (% defectuosos máximo)",
+                          min_value=min(pL_percent, 99.0), max_value=100.0,
+                          value=min(max(5.0, pL_percent*3), 100.0), step=0.5, format="%.1f%%")
+    p_vals, Pa_vals = curva(p_max_pct / 100)
+    grafico = grafico_curva(p_vals, Pa_vals, pL_percent, beta, titulo, etiqueta, grosor)
+    st.altair_chart(grafico, width="stretch")
@@ -0,0 +1,211 @@
+# -----------------------------------------------------------
+# NÚCLEO DE CÁLCULO: Planes de muestreo LTPD - modelo hipergeométrico
+# Autor: Juan Camilo Plazas
+# Descripción:
+# Funciones compartidas por las apps LTPD (c = 0 y c variable): probabilidad
+# de aceptación, búsqueda del tamaño de muestra n, curva CO y AOQL.
+# Basado en: Gutiérrez Pulido, "Control Estadístico de la Calidad y Seis Sigma" (pp. 331–333)
+# -----------------------------------------------------------
+
+import math
+from functools import lru_cache
+import numpy as np
+import streamlit as st
+
+# -----------------------------------------------------------
+# TABLAS COMPARTIDAS
+# -----------------------------------------------------------
+
+@st.cache_resource(max_entries=16)
+def _log_factoriales(N_max):
+    """
+    Tabla lf[k] = ln(k!) para k = 0..N_max, construida una sola vez por N_max
+    y compartida entre reruns y sesiones (solo lectura). Se guardan a lo sumo
+    16 tablas: N lo elige el usuario y cada tabla ocupa N+1 floats.
+    """
+    lf = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, N_max + 1)))))
+    lf.setflags(write=False)
+    return lf
+
+
+@lru_cache(maxsize=64)
+def _indices(n):
+    """
+    Índices i = 0..n-1 como arreglo float64 contiguo (solo lectura), creado una
+    sola vez por n: los productos de P0 operan sobre él sin volver a asignarlo.
+    lru_cache y no st.cache_resource: se consulta en cada P0 y debe costar
+    menos que el propio np.arange.
+    """
+    i = np.arange(n, dtype=np.float64)
+    i.setflags(write=False)
+    return i
+
+
+@st.cache_resource(max_entries=16)
+def _inv_denominador(N):
+    """
+    Inversos 1 / (N - i), i = 0..N-1, de los denominadores de P0 (solo lectura).
+    Solo los usa la curva CO: la búsqueda de n divide entre (N - i), porque el
+    recíproco redondea distinto y rompe los empates exactos Pₐ = β.
+    Como en _log_factoriales, se guardan a lo sumo 16 tablas.
+    """
+    inv = 1.0 / (N - _indices(N))
+    inv.setflags(write=False)
+    return inv
+
+# -----------------------------------------------------------
+# PROBABILIDAD DE ACEPTACIÓN
+# -----------------------------------------------------------
+
+def defectuosos_lote(N, p):
+    """
+    Número de defectuosos D = ceil(N·p) como entero(s) int64; p puede ser un
+    escalar o un arreglo. N·p se redondea antes del techo para que el error de
+    punto flotante (p. ej. 100·0.07 = 7.000000000000001) no sume un defectuoso.
+    """
+    return np.ceil(np.round(N * np.asarray(p, dtype=np.float64), 9)).astype(np.int64)
+
+
+def prob_zero_defects(N, D, n):
+    """
+    Calcula la probabilidad de aceptar un lote con c = 0 (sin defectos encontrados)
+    usando el modelo HIPERGEOMÉTRICO (sin reemplazo):
+        P0 = C(N-D, n) / C(N, n)
+    Se calcula como un producto de cocientes (arreglo float64, np.multiply.reduce)
+    para evitar overflow, con los índices i = 0..n-1 en caché.
+    """
+    if n == 0: return 1.0
+    if D <= 0: return 1.0
+    if n > N: return 0.0
+    i = _indices(n)
+    p0 = float(np.multiply.reduce((N - D - i) / (N - i)))
+    return max(min(p0, 1.0), 0.0)
+
+
+def prob_aceptacion(N, D, n, c):
+    """
+    Calcula la probabilidad de aceptación Pₐ para un plan (N, n, c)
+    usando la distribución HIPERGEOMÉTRICA:
+        Pₐ = Σ [C(D, x) * C(N-D, n-x)] / C(N, n)
+    equivalente a DISTR.HIPERGEOM.N(...;1) en Excel.
+    Se evalúa con el núcleo compilado pa_nucleo (sin enteros grandes); numba se
+    importa aquí y no al cargar el módulo, así la app de c = 0 no lo necesita.
+    """
+    from ltpd_nucleo import pa_nucleo
+    return pa_nucleo(N, D, n, c)
+
+
+def prob_aceptacion_vec(N, Ds, n, c):
+    """
+    Calcula Pₐ para varios valores de D a la vez (todos con el mismo plan N, n, c).
+    La tabla de log-factoriales y ln C(N, n) se obtienen una sola vez y se
+    reutilizan para todos los D; cada fila suma los términos x = 0..c válidos.
+    """
+    lf = _log_factoriales(N)
+    log_C_Nn = lf[N] - lf[n] - lf[N - n]
+    D = np.minimum(np.asarray(Ds, dtype=np.int64), N)[:, None]
+    x = np.arange(min(c, n) + 1)[None, :]
+    # x fuera del soporte [max(0, n-(N-D)), min(n, D)] se recorta y luego se anula
+    xs = np.clip(x, np.maximum(0, n - (N - D)), np.minimum(n, D))
+    log_pmf = (lf[D] - lf[xs] - lf[D - xs]
+               + lf[N - D] - lf[n - xs] - lf[N - D - n + xs]
+               - log_C_Nn)
+    Pa = np.where(xs == x, np.exp(log_pmf), 0.0).sum(axis=1)
+    return np.where(np.asarray(Ds) > N, 0.0, Pa)
+
+# -----------------------------------------------------------
+# PLAN DE MUESTREO Y CURVA CO
+# -----------------------------------------------------------
+
+def encontrar_n_hipergeometrica(N, pL, beta, c=0):
+    """
+    Encuentra el tamaño mínimo de muestra (n) que cumple:
+        Pₐ(LTPD) ≤ β
+    para un valor de c (número de aceptación) dado, con D = ceil(N·pL).
+    Pₐ(n) es monótona decreciente en n, así que n se ubica por búsqueda binaria.
+    Con c = 0 todos los P0(n) salen de un único producto acumulado, cortado en
+    la semilla binomial n0 = ceil(ln β / ln(1-pL)): como P0(n) ≤ (1-pL)^n, n0 ya
+    cumple y el n buscado nunca es mayor.
+    """
+    D = int(defectuosos_lote(N, pL))  # defectuosos esperados en el lote límite
+    # Tolerancia relativa, igual para c = 0 y c > 0: un Pₐ exactamente igual a β
+    # no debe quedar por encima solo por el redondeo del producto o de la suma
+    limite = beta * (1 + 1e-9)
+    if c == 0:
+        if D >= N:  # lote límite todo defectuoso: P0(n) = 0 para cualquier n ≥ 1
+            return 1, D, 0.0
+        m = N if pL <= 0 else min(N, max(1, math.ceil(math.log(beta) / math.log(1 - pL))))
+        i = _indices(N)[:m]
+        P0_all = np.cumprod((N - D - i) / (N - i))  # P0_all[n-1] = P0(n), como en prob_zero_defects
+        idx = int(np.searchsorted(-P0_all, -limite, side="left"))
+        n = min(idx + 1, m)  # idx == m: ningún n ≤ N cumple (m = N) o empate en n0
+        return n, D, max(min(float(P0_all[n - 1]), 1.0), 0.0)
+    lo, hi = 1, N
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if prob_aceptacion(N, D, mid, c) <= limite:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo, D, prob_aceptacion(N, D, lo, c)
+
+
+def malla_p(pL, p_max):
+    """
+    Valores de p (fracción defectuosa) para graficar la curva: 60 puntos,
+    concentrados alrededor del codo de la curva (0.5·pL a 1.5·pL), donde está
+    la información visual; las colas casi planas llevan pocos puntos.
+    """
+    p_codo = min(pL * 1.5, p_max)
+    return np.concatenate([
+        np.linspace(0, pL * 0.5, 10, endpoint=False),
+        np.linspace(pL * 0.5, p_codo, 30, endpoint=False),
+        np.linspace(p_codo, p_max, 20),
+    ])
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def curva_CO(N, n, c, pL, p_max=0.08):
+    """
+    Calcula la Curva CO (Característica de Operación)
+    mostrando la probabilidad de aceptación frente al % de defectuosos.
+    Pₐ se evalúa una sola vez por cada D = ceil(N·p) distinto; con c = 0 cada
+    P0 es un producto sobre las tablas de índices y de inversos 1/(N-i).
+    El deslizador del gráfico crea una entrada por p_max: la caché se limita a 64.
+    """
+    p_vals = malla_p(pL, p_max)
+    D_unicos, inv = np.unique(defectuosos_lote(N, p_vals), return_inverse=True)
+    if c == 0:
+        i = _indices(n)
+        inv_den = _inv_denominador(N)[:n]
+        P0 = [np.multiply.reduce((N - D - i) * inv_den) for D in np.minimum(D_unicos, N)]
+        Pa_unicos = np.clip(P0, 0.0, 1.0)
+    else:
+        Pa_unicos = prob_aceptacion_vec(N, D_unicos, n, c)
+    return p_vals * 100, Pa_unicos[inv] * 100
+
+
+def aoql_aprox(N, n):
+    """
+    Calcula el AOQL aproximado según la fórmula empírica:
+        AOQL ≈ 0.3679 / (N · f)
+    donde f = n / N es la fracción inspeccionada.
+    (Fórmula válida principalmente para planes con c = 0)
+    """
+    f = n / N
+    return 0.3679 / (N * f) if f > 0 else float('nan')
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def calcular_plan(N, pL, beta, c=0):
+    """
+    Calcula el plan (n, D, Pₐ y AOQL) para (N, pL, β, c).
+    El resultado queda en caché: un rerun con los mismos parámetros
+    no repite la búsqueda de n. La curva CO se pide aparte (curva_CO,
+    también en caché) desde el fragmento del gráfico. (N, pL, β, c) los elige
+    el usuario, así que la caché se limita a 64 planes.
+    """
+    n, D, Pa = encontrar_n_hipergeometrica(N, pL, beta, c)
+    AOQL = aoql_aprox(N, n)
+    return n, D, Pa, AOQL
+
@@ -0,0 +1,41 @@
+# -----------------------------------------------------------
+# NÚCLEO COMPILADO (Numba) de la probabilidad de aceptación, c > 0
+# Autor: Juan Camilo Plazas
+# Descripción:
+# Separado de ltpd_core para que solo las apps con c variable carguen numba
+# y paguen la compilación; la app de c = 0 no lo importa nunca.
+# -----------------------------------------------------------
+
+import math
+from numba import njit
+
+
+@njit(cache=True)
+def pa_nucleo(N, D, n, c):
+    """
+    Núcleo compilado (Numba) de Pₐ: parte del primer x posible y encadena los
+    términos con la recurrencia
+        P(x+1) / P(x) = (D-x)(n-x) / [(x+1)(N-D-n+x+1)]
+    El término se lleva en escala logarítmica para que no se anule en lotes grandes.
+    """
+    x0 = max(0, n - (N - D))  # mínimo de defectuosos posible en la muestra
+    x1 = min(c, D, n)
+    if x0 > x1:
+        return 0.0
+    log_t = 0.0
+    if x0 == 0:
+        for i in range(n):  # P(0) = C(N-D, n) / C(N, n)
+            log_t += math.log((N - D - i) / (N - i))
+    else:
+        for i in range(N - n):  # P(x0): las N-n piezas no muestreadas son defectuosas
+            log_t += math.log((D - i) / (N - i))
+    s = math.exp(log_t)
+    for x in range(x0, x1):
+        log_t += math.log((D - x) * (n - x) / ((x + 1) * (N - D - n + x + 1)))
+        s += math.exp(log_t)
+    return s
+
+
+# El módulo se importa una sola vez por proceso: el núcleo se compila aquí,
+# al cargar la app, y no en el primer clic.
+pa_nucleo(10, 1, 1, 0)